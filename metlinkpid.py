@@ -1,13 +1,13 @@
-import re
-import struct
+import binascii
 from abc import ABC, abstractmethod
-from contextlib import suppress, AbstractContextManager
+from contextlib import AbstractContextManager
 from enum import Enum
-from typing import Mapping, Sequence, Union, Type
+from functools import lru_cache
+from string import ascii_letters
+from typing import FrozenSet, Mapping, Optional, Sequence, Union, Type
 
 import attr
 import dlestxetx
-from crccheck.crc import CrcX25
 from serial import Serial
 
 
@@ -53,8 +53,21 @@ class PageAnimate(Enum):
     """
 
 
-@attr.s(frozen=True)
-class Page:
+class _Cached:
+    """
+    A base class providing slots in which immutable objects
+    can cache their string & raw byte representations.
+
+    The slots are declared here rather than as attrs fields
+    so that they stay out of :func:`attr.fields`, :func:`attr.asdict`, and so on.
+    An unset slot means that the representation hasn't been computed yet.
+    """
+
+    __slots__ = ('_str', '_bytes')
+
+
+@attr.s(frozen=True, slots=True)
+class Page(_Cached):
     # noinspection PyUnresolvedReferences
     """
     A :class:`Page` object represents one "screen" of information in a :class:`DisplayMessage`.
@@ -122,6 +135,9 @@ class Page:
         if the text contains unusable characters,
         or if a valid :class:`PageAnimate` value is not given,
         or if the delay is outside the permissible range.
+
+    Because :class:`Page` objects are immutable,
+    :meth:`to_bytes` only validates & encodes the text the first time it is called.
     """
     animate: PageAnimate = attr.ib()
     delay: int = attr.ib()
@@ -172,16 +188,41 @@ class Page:
     _RIGHT_CHAR_ENCODED = r'\R'
     _NEWLINE_CHAR = '_'
     _NEWLINE_BYTESEQ = b'\x0A'
-    _STR_RE = re.compile(
-        r'\A(?:(?P<animate>[A-Za-z]?)(?P<delay>\d*)' + re.escape(_ATTRS_SEP) + r')?(?P<text>.*)\Z',
-        re.DOTALL
-    )
+
+    _TEXT_CHARS: FrozenSet[str] = frozenset([*_TEXT_ENCODING, _NEWLINE_CHAR])
+    _TEXT_CHARS_REPR = repr(''.join(_TEXT_ENCODING))
+    _TEXT_ENCODE_TABLE: Mapping[int, int] = str.maketrans({
+        **{char: byte[0] for char, byte in _TEXT_ENCODING.items()},
+        _NEWLINE_CHAR: _NEWLINE_BYTESEQ[0],
+    })
+    """
+    A :meth:`str.translate` table equivalent to :attr:`_TEXT_ENCODING`
+    (plus the newline character),
+    mapping the code point of each permissible character
+    to the Latin-1 code point of the equivalent display-level byte.
+    """
+
+    _TEXT_DECODE_TABLE: Mapping[int, str] = {
+        **dict.fromkeys(range(0x100), '\N{REPLACEMENT CHARACTER}'),
+        **{ord(byte): char for byte, char in _TEXT_DECODING.items()},
+        _NEWLINE_BYTESEQ[0]: _NEWLINE_CHAR,
+    }
+    """
+    A :meth:`str.translate` table equivalent to :attr:`_TEXT_DECODING`
+    (plus the newline byte),
+    to be applied to display-level bytes decoded as Latin-1.
+    Every byte without a corresponding character
+    maps to the Unicode "Replacement Character" (``�``).
+    """
+
     _ANIMATE_ENCODING: Mapping[PageAnimate, int] = {
         PageAnimate.NONE: 0x00,
         PageAnimate.VSCROLL: 0x1D,
         PageAnimate.HSCROLL: 0x2F,
     }
-    _ANIMATE_DECODING: Mapping[int, PageAnimate] = {byte: animate for animate, byte in _ANIMATE_ENCODING.items()}
+    _ANIMATE_DECODING: Sequence[Optional[PageAnimate]] = tuple(
+        map({byte: animate for animate, byte in _ANIMATE_ENCODING.items()}.get, range(0x100))
+    )
 
     @classmethod
     def from_str(cls, string: str, default_animate: PageAnimate = PageAnimate.NONE, default_delay: int = 20) -> 'Page':
@@ -223,16 +264,21 @@ class Page:
             or if a valid :class:`Animate` value is not given,
             or if the delay is outside the permissible range.
         """
-        match = cls._STR_RE.match(string)
-        if match.group('animate'):
-            animate = PageAnimate(match.group('animate').upper())
+        head, sep, text = string.partition(cls._ATTRS_SEP)
+        animate_str, delay_str = '', head
+        if head[:1] and head[:1] in ascii_letters:
+            animate_str, delay_str = head[0], head[1:]
+        if not sep or (delay_str and not delay_str.isdecimal()):
+            animate_str, delay_str, text = '', '', string
+        if animate_str:
+            animate = PageAnimate(animate_str.upper())
         else:
             animate = default_animate
-        if match.group('delay'):
-            delay = int(match.group('delay'))
+        if delay_str:
+            delay = int(delay_str)
         else:
             delay = default_delay
-        return Page(animate=animate, delay=delay, text=match.group('text'))
+        return Page(animate=animate, delay=delay, text=text)
 
     @classmethod
     def from_bytes(cls, bytes_in: bytes) -> 'Page':
@@ -250,18 +296,16 @@ class Page:
         """
         if len(bytes_in) < 4:
             raise ValueError('not enough bytes for a Page')
-        try:
-            animate = cls._ANIMATE_DECODING[bytes_in[0]]
-        except KeyError:
+        animate = cls._ANIMATE_DECODING[bytes_in[0]]
+        if animate is None:
             raise NotImplementedError(f'unexpected animate byte value {bytes_in[0]!r} at index 0')
         offset = bytes_in[1]
         delay = bytes_in[2]
         if bytes_in[3] != 0x00:
             raise NotImplementedError(f'unexpected byte value {bytes_in[3]!r} at index 3')
-        text = cls._NEWLINE_CHAR.join(
-            cls._decode_text(text_line).rstrip(' ').replace(cls._RIGHT_CHAR_ENCODED, cls._RIGHT_CHAR_DECODED)
-            for text_line in bytes_in[4:].rstrip(cls._NEWLINE_BYTESEQ).split(cls._NEWLINE_BYTESEQ)
-        )
+        text_lines = cls._decode_text(bytes_in[4:].rstrip(cls._NEWLINE_BYTESEQ)).split(cls._NEWLINE_CHAR)
+        text = cls._NEWLINE_CHAR.join([text_line.rstrip(' ') for text_line in text_lines])
+        text = text.replace(cls._RIGHT_CHAR_ENCODED, cls._RIGHT_CHAR_DECODED)
         text = (cls._NEWLINE_CHAR * offset) + text
         return Page(animate=animate, delay=delay, text=text)
 
@@ -272,7 +316,11 @@ class Page:
         Passing this string to :meth:`Page.from_str`
         will yield an equivalent :class:`Page` object to this one.
         """
-        return self.animate.value + str(self.delay) + self._ATTRS_SEP + self.text
+        str_out = getattr(self, '_str', None)
+        if str_out is None:
+            str_out = self.animate.value + str(self.delay) + self._ATTRS_SEP + self.text
+            object.__setattr__(self, '_str', str_out)
+        return str_out
 
     def to_bytes(self) -> bytes:
         """
@@ -281,19 +329,21 @@ class Page:
         Used by :meth:`DisplayMessage.to_bytes`
         when preparing to :meth:`~PID.send()` a complete :class:`DisplayMessage` to the display.
         """
-        animate_byte = bytes([self._ANIMATE_ENCODING[self.animate]])
-        offset_byte = bytes([len(self.text) - len(self.text.lstrip(self._NEWLINE_CHAR))])
-        delay_byte = bytes([self.delay])
-        text_bytes = b'\x0A'.join(
-            self._encode_text(text.replace(self._RIGHT_CHAR_DECODED, self._RIGHT_CHAR_ENCODED))
-            for text in self.text[ord(offset_byte):].split(self._NEWLINE_CHAR)
-        )
-        return animate_byte + offset_byte + delay_byte + b'\x00' + text_bytes
+        bytes_out = getattr(self, '_bytes', None)
+        if bytes_out is None:
+            text = self.text.lstrip(self._NEWLINE_CHAR)
+            offset = len(self.text) - len(text)
+            header_bytes = bytes([self._ANIMATE_ENCODING[self.animate], offset, self.delay, 0x00])
+            text_bytes = self._encode_text(text.replace(self._RIGHT_CHAR_DECODED, self._RIGHT_CHAR_ENCODED))
+            bytes_out = header_bytes + text_bytes
+            object.__setattr__(self, '_bytes', bytes_out)
+        return bytes_out
 
     @classmethod
     def _encode_text(cls, text: str) -> bytes:
         """
-        Convert a string of characters into a string of display-level bytes.
+        Convert a string of characters into a string of display-level bytes,
+        with each newline character (``_``) becoming a display-level newline byte.
         Called from the :meth:`to_bytes` method.
 
         :param text:
@@ -302,24 +352,19 @@ class Page:
         :raise ValueError:
             if any of the characters in the input are unable to be displayed.
         """
-        bytes_out = bytes()
-        bad_chars = set()
-        for char in text:
-            try:
-                bytes_out += cls._TEXT_ENCODING[char]
-            except KeyError:
-                bad_chars.add(char)
-        if bad_chars:
+        if not cls._TEXT_CHARS.issuperset(text):
+            bad_chars = {char for char in text if char not in cls._TEXT_CHARS}
             raise ValueError(
                 f"{', '.join(repr(char) for char in bad_chars)} not in allowed characters"
-                f" ({repr(''.join(cls._TEXT_ENCODING.keys()))})"
+                f" ({cls._TEXT_CHARS_REPR})"
             )
-        return bytes_out
+        return text.translate(cls._TEXT_ENCODE_TABLE).encode('latin-1')
 
     @classmethod
     def _decode_text(cls, bytes_in: bytes) -> str:
         """
-        Convert a string of display-level bytes into a string of characters.
+        Convert a string of display-level bytes into a string of characters,
+        with each display-level newline byte becoming a newline character (``_``).
         Any byte without a corresponding character
         is converted to the Unicode "Replacement Character" (``�``).
         Called from the :meth:`Page.from_bytes` method.
@@ -327,13 +372,7 @@ class Page:
         :param bytes_in:
             the display-level bytes.
         """
-        text: str = ''
-        for byte in (bytes([int_in]) for int_in in bytes_in):
-            try:
-                text += cls._TEXT_DECODING[byte]
-            except KeyError:
-                text += '\N{REPLACEMENT CHARACTER}'
-        return text
+        return bytes_in.decode('latin-1').translate(cls._TEXT_DECODE_TABLE)
 
 
 class Message(ABC):
@@ -343,13 +382,23 @@ class Message(ABC):
     Its existence allows for simplified implementation & return typing of the :func:`inspect` function.
     """
 
-    @classmethod
+    __slots__ = ()
+
+    @property
     @abstractmethod
+    def _MARKER(self) -> bytes:
+        """
+        The value returned by :meth:`marker`,
+        which each subclass must override with a :class:`bytes` class attribute.
+        """
+
+    @classmethod
     def marker(cls) -> bytes:
         """
         The :class:`bytes` that a raw byte representation must start with
         in order to possibly be an instance of this :class:`Message` subclass.
         """
+        return cls._MARKER
 
     @classmethod
     @abstractmethod
@@ -367,7 +416,7 @@ class Message(ABC):
         """
 
 
-@attr.s(frozen=True)
+@attr.s(frozen=True, slots=True)
 class PingMessage(Message):
     # noinspection PyUnresolvedReferences
     """
@@ -385,13 +434,11 @@ class PingMessage(Message):
 
     unspecified_byte: int = attr.ib(default=0x6F)
 
-    @classmethod
-    def marker(cls) -> bytes:
-        return b'\x01\x50'
+    _MARKER = b'\x01\x50'
 
     @classmethod
     def from_bytes(cls, bytes_in: bytes) -> 'PingMessage':
-        if not bytes_in.startswith(cls.marker()):
+        if not bytes_in.startswith(cls._MARKER):
             raise ValueError('incorrect header for PingMessage')
         if len(bytes_in) < 3:
             raise ValueError('unexpected end of data')
@@ -400,10 +447,10 @@ class PingMessage(Message):
         return PingMessage(unspecified_byte=bytes_in[2])
 
     def to_bytes(self) -> bytes:
-        return self.marker() + bytes([self.unspecified_byte])
+        return self._MARKER + bytes([self.unspecified_byte])
 
 
-@attr.s(frozen=True)
+@attr.s(frozen=True, slots=True)
 class ResponseMessage(Message):
     # noinspection PyUnresolvedReferences
     """
@@ -423,13 +470,11 @@ class ResponseMessage(Message):
 
     unspecified_byte: int = attr.ib()
 
-    @classmethod
-    def marker(cls) -> bytes:
-        return b'\x01\x52'
+    _MARKER = b'\x01\x52'
 
     @classmethod
     def from_bytes(cls, bytes_in: bytes) -> 'ResponseMessage':
-        if not bytes_in.startswith(cls.marker()):
+        if not bytes_in.startswith(cls._MARKER):
             raise ValueError('incorrect header for ResponseMessage')
         if len(bytes_in) < 4:
             raise ValueError('unexpected end of data')
@@ -440,11 +485,11 @@ class ResponseMessage(Message):
         return ResponseMessage(unspecified_byte=bytes_in[2])
 
     def to_bytes(self) -> bytes:
-        return self.marker() + bytes([self.unspecified_byte]) + b'\x00'
+        return self._MARKER + bytes([self.unspecified_byte]) + b'\x00'
 
 
-@attr.s(frozen=True, repr=False)
-class DisplayMessage(Message):
+@attr.s(frozen=True, slots=True, repr=False)
+class DisplayMessage(Message, _Cached):
     # noinspection PyUnresolvedReferences
     """
     A :class:`DisplayMessage` object represents a single, cohesive set of information
@@ -459,16 +504,19 @@ class DisplayMessage(Message):
 
     :param pages:
         a :class:`tuple` of :class:`Page` objects comprising the message.
+
+    A :class:`DisplayMessage` never changes once constructed,
+    so its string form and :meth:`to_bytes` result are kept after first use,
+    making repeated sends of the same object cheap.
     """
     pages: Sequence[Page] = attr.ib(converter=tuple)
 
     _PAGE_SEP = '|'
 
-    @classmethod
-    def marker(cls) -> bytes:
-        return b'\x01\x44\x00'
+    _MARKER = b'\x01\x44\x00'
 
     @classmethod
+    @lru_cache(maxsize=256)
     def from_str(cls, string: str) -> 'DisplayMessage':
         """
         Construct a :class:`DisplayMessage` object from a string representation.
@@ -501,19 +549,22 @@ class DisplayMessage(Message):
             *   :attr:`Animate.VSCROLL` & ``delay=40`` for the first page; and
             *   :attr:`Animate.HSCROLL` & ``delay=0`` for subsequent pages.
 
+        Results are cached by string,
+        so repeatedly sending the same string to the display
+        doesn't repeatedly parse it.
+
         :raise ValueError:
             if the text of any page contains unusable characters,
             or if a valid Animate value is not given,
             or if the delay is outside the permissible range.
         """
-        return DisplayMessage(pages=tuple(
-            Page.from_str(
-                string=page_str,
-                default_delay=40 if index == 0 else 0,
-                default_animate=PageAnimate.VSCROLL if index == 0 else PageAnimate.HSCROLL
-            )
-            for index, page_str in enumerate(string.split(cls._PAGE_SEP))
-        ))
+        first_page_str, *other_page_strs = string.split(cls._PAGE_SEP)
+        pages = [Page.from_str(string=first_page_str, default_animate=PageAnimate.VSCROLL, default_delay=40)]
+        pages += [
+            Page.from_str(string=page_str, default_animate=PageAnimate.HSCROLL, default_delay=0)
+            for page_str in other_page_strs
+        ]
+        return DisplayMessage(pages=pages)
 
     @classmethod
     def from_bytes(cls, bytes_in: bytes) -> 'DisplayMessage':
@@ -527,23 +578,18 @@ class DisplayMessage(Message):
         :raise ValueError:
             if the bytes could not be understood.
         """
-        if not bytes_in.startswith(cls.marker()):
-            raise ValueError(f'data must start with {cls.marker()!r}')
-        index = len(cls.marker())
+        if not bytes_in.startswith(cls._MARKER):
+            raise ValueError(f'data must start with {cls._MARKER!r}')
+        index = len(cls._MARKER)
+        if not bytes_in.endswith(b'\x0D'):
+            raise ValueError('unexpected end of data')
         pages = []
-        while True:
-            if pages:
-                if bytes_in[index] != 0x01:
-                    raise ValueError(f'unexpected byte value {bytes_in[index]!r} at index {index}')
-                index += 1
-            try:
-                end = bytes_in.index(b'\x0D', index)
-            except ValueError:
-                raise ValueError('unexpected end of data')
-            pages.append(Page.from_bytes(bytes_in[index:end]))
-            index = end + 1
-            if index == len(bytes_in):
-                break
+        for page_bytes in bytes_in[index:-1].split(b'\x0D\x01'):
+            if b'\x0D' in page_bytes:
+                index += page_bytes.index(b'\x0D') + 1
+                raise ValueError(f'unexpected byte value {bytes_in[index]!r} at index {index}')
+            pages.append(Page.from_bytes(page_bytes))
+            index += len(page_bytes) + 2
         return DisplayMessage(pages=pages)
 
     def __str__(self) -> str:
@@ -553,14 +599,22 @@ class DisplayMessage(Message):
         Passing this string to :meth:`DisplayMessage.from_str`
         will yield an equivalent :class:`DisplayMessage` object to this one.
         """
-        return self._PAGE_SEP.join([str(page) for page in self.pages])
+        str_out = getattr(self, '_str', None)
+        if str_out is None:
+            str_out = self._PAGE_SEP.join([str(page) for page in self.pages])
+            object.__setattr__(self, '_str', str_out)
+        return str_out
 
     def to_bytes(self) -> bytes:
         """
         The raw byte representation of the :class:`DisplayMessage` as understood by the display
         (not including the CRC-checksumming and packet-framing required for transmission).
         """
-        return self.marker() + b'\x0D\x01'.join(page.to_bytes() for page in self.pages) + b'\x0D'
+        bytes_out = getattr(self, '_bytes', None)
+        if bytes_out is None:
+            bytes_out = self._MARKER + b'\x0D\x01'.join([page.to_bytes() for page in self.pages]) + b'\x0D'
+            object.__setattr__(self, '_bytes', bytes_out)
+        return bytes_out
 
     def __repr__(self) -> str:
         return 'DisplayMessage.from_str({!r})'.format(str(self))
@@ -649,11 +703,11 @@ class PID(AbstractContextManager):
             (usually a :class:`DisplayMessage` but sometimes a :class:`PingMessage`),
             it is converted :meth:`~Message.to_bytes`,
             then CRC-checksummed and packet-framed before sending.
-        *   If a :class:`bytes` object is provided that **is not** a valid DLE/STX/ETX packet
+        *   If a :class:`bytes` object is provided that **is not** delimited like a DLE/STX/ETX packet
             (``\\x10\\x02 ··· \\x10\\x03``),
             the bytes are CRC-checksummed and packet-framed before sending.
-        *   If a :class:`bytes` object is provided that **is** a valid DLE/STX/ETX packet,
-            the packet is assumed to already contain a correct CRC checksum
+        *   If a :class:`bytes` object is provided that **is** delimited like a DLE/STX/ETX packet,
+            the packet is assumed to be valid and to already contain a correct CRC checksum,
             and sent without change.
 
         :param data:
@@ -670,14 +724,27 @@ class PID(AbstractContextManager):
             data = DisplayMessage.from_str(data)
         if isinstance(data, Message):
             data = data.to_bytes()
-        # noinspection PyUnusedLocal
-        is_framed = False
-        with suppress(ValueError):
-            dlestxetx.decode(data)
-            is_framed = True
-        if not is_framed:
-            data = dlestxetx.encode(data + _crc(data))
-        self.serial.write(data)
+        if not (data.startswith(b'\x10\x02') and data.endswith(b'\x10\x03')):
+            data = _frame(data)
+        self._transmit(data)
+
+    def _transmit(self, packet: bytes) -> None:
+        """
+        Write a DLE/STX/ETX packet to the display
+        and (unless ``ignore_responses`` is set) verify its acknowledgement.
+        Called from the :meth:`send` and :meth:`ping` methods.
+
+        :param packet:
+            the complete packet, including CRC checksum and framing.
+
+        :raise serial.SerialTimeoutException:
+            if the display doesn't respond with acknowledgement.
+
+        :raise serial.SerialException:
+            if any other serial device error occurs,
+            such as the serial port being closed.
+        """
+        self.serial.write(packet)
         if not self.ignore_responses:
             response = _uncrc(dlestxetx.read(self.serial))
             if self.serial.in_waiting:
@@ -695,10 +762,13 @@ class PID(AbstractContextManager):
         In deployment, Metlink displays are typically pinged every ten seconds
         in addition to all other traffic sent to them.
 
-        This method is simply a convenience wrapper for :meth:`send`-ing a :class:`PingMessage`::
+        This method is equivalent to :meth:`send`-ing a :class:`PingMessage`::
 
             pid.send(PingMessage())
 
+        but since the ping packet never changes,
+        it is prepared once rather than on every call.
+
         :raise serial.SerialTimeoutException:
             if the display doesn't respond with acknowledgement.
 
@@ -706,7 +776,7 @@ class PID(AbstractContextManager):
             if any other serial device error occurs,
             such as the serial port being closed.
         """
-        self.send(PingMessage())
+        self._transmit(_PING_PACKET)
 
     def close(self) -> None:
         """
@@ -738,6 +808,21 @@ class PID(AbstractContextManager):
         return False
 
 
+_MESSAGE_TYPES: Mapping[bytes, Type[Message]] = {
+    cls._MARKER: cls for cls in (PingMessage, ResponseMessage, DisplayMessage)
+}
+"""
+A mapping from the :meth:`~Message.marker` of each :class:`Message` subclass
+to the subclass itself,
+enabling :func:`inspect` to find the matching subclass with dictionary lookups.
+"""
+
+_MESSAGE_MARKER_LENGTHS: Sequence[int] = sorted({len(marker) for marker in _MESSAGE_TYPES})
+"""
+The distinct lengths of the :data:`_MESSAGE_TYPES` markers, shortest first, which :func:`inspect` tries in turn.
+"""
+
+
 def inspect(bytes_in: bytes) -> Message:
     """
     The :func:`inspect` function is used
@@ -759,21 +844,26 @@ def inspect(bytes_in: bytes) -> Message:
         if a DLE/STX/ETX packet is provided with a bad CRC checksum,
         or if the bytes can't be understood.
     """
-    # noinspection PyUnusedLocal
-    was_framed = False
-    with suppress(ValueError):
-        bytes_in = dlestxetx.decode(bytes_in)
-        was_framed = True
-    if was_framed:
-        bytes_in = _uncrc(bytes_in)
-    # noinspection PyUnusedLocal
-    cls: Type[Message]
-    for cls in Message.__subclasses__():
-        if bytes_in.startswith(cls.marker()):
+    bytes_in = bytes(bytes_in)
+    if bytes_in.startswith(b'\x10\x02'):
+        bytes_in = _uncrc(_unframe(bytes_in))
+    for marker_length in _MESSAGE_MARKER_LENGTHS:
+        cls = _MESSAGE_TYPES.get(bytes_in[:marker_length])
+        if cls is not None:
             return cls.from_bytes(bytes_in)
     raise ValueError('unrecognised byte sequence')
 
 
+_BIT_REVERSAL: bytes = bytes(int(f'{byte:08b}'[::-1], 2) for byte in range(0x100))
+"""
+A :meth:`bytes.translate` table mapping each byte to the byte with the reverse bit order.
+
+X.25 is the bit-reversed form of the CRC-CCITT checksum,
+so reversing the bits going in and out of :func:`binascii.crc_hqx`
+allows X.25 checksums to be calculated in C rather than in Python.
+"""
+
+
 def _crc(bytes_in: bytes) -> bytes:
     """
     Generate an X.25_ checksum for the specified byte sequence.
@@ -787,7 +877,32 @@ def _crc(bytes_in: bytes) -> bytes:
     :return:
         a two-byte :class:`bytes` sequence in the order expected by the display.
     """
-    return struct.pack('<H', CrcX25.calc(bytes_in))
+    return _crc_int(bytes_in).to_bytes(2, 'little')
+
+
+def _crc_int(bytes_in: bytes) -> int:
+    """
+    Generate an X.25 checksum for the specified byte sequence as an :class:`int`.
+    Called from :func:`_crc` and :func:`_uncrc`.
+
+    :param bytes_in:
+        the bytes to generate the checksum for.
+    """
+    crc = binascii.crc_hqx(bytes_in.translate(_BIT_REVERSAL), 0xFFFF)
+    crc = (_BIT_REVERSAL[crc & 0xFF] << 8) | _BIT_REVERSAL[crc >> 8]
+    return crc ^ 0xFFFF
+
+
+@lru_cache(maxsize=64)
+def _cached_crc(bytes_in: bytes) -> bytes:
+    """
+    Equivalent to :func:`_crc`, but with results cached,
+    so that repeatedly sending the same message doesn't repeatedly checksum it.
+
+    Only used for outgoing data,
+    so that checksumming received data can't displace cached checksums.
+    """
+    return _crc(bytes_in)
 
 
 def _uncrc(bytes_in: bytes) -> bytes:
@@ -808,7 +923,63 @@ def _uncrc(bytes_in: bytes) -> bytes:
     if len(bytes_in) < 2:
         raise ValueError('value must be at least 2 bytes in length')
     bytes_out, crc_in = bytes_in[:-2], bytes_in[-2:]
-    crc_out = _crc(bytes_out)
-    if crc_in != crc_out:
-        raise ValueError(f'got CRC value {crc_in!r} when {crc_out!r} was expected')
+    crc_out = _crc_int(bytes_out)
+    if int.from_bytes(crc_in, 'little') != crc_out:
+        raise ValueError(f"got CRC value {crc_in!r} when {crc_out.to_bytes(2, 'little')!r} was expected")
     return bytes_out
+
+
+def _frame(bytes_in: bytes) -> bytes:
+    """
+    CRC-checksum the specified byte sequence using :func:`_cached_crc`
+    and wrap the result into a DLE/STX/ETX packet.
+
+    Equivalent to ``dlestxetx.encode(bytes_in + _crc(bytes_in))``,
+    but the data and checksum are byte-stuffed separately and joined once,
+    rather than the data being copied once to append the checksum
+    and twice more to add the packet header & footer.
+
+    :param bytes_in:
+        the bytes to checksum and frame.
+
+    :return:
+        the DLE/STX/ETX packet.
+    """
+    return b''.join([
+        b'\x10\x02',
+        bytes_in.replace(b'\x10', b'\x10\x10'),
+        _cached_crc(bytes(bytes_in)).replace(b'\x10', b'\x10\x10'),
+        b'\x10\x03',
+    ])
+
+
+def _unframe(bytes_in: bytes) -> bytes:
+    """
+    Unwrap data from a DLE/STX/ETX packet.
+
+    Equivalent to ``dlestxetx.decode(bytes_in)``,
+    but validates and un-stuffs the data with :meth:`bytes.replace`
+    rather than reading through it two bytes at a time.
+
+    :param bytes_in:
+        the packet to unwrap.
+
+    :return:
+        the data within the packet
+        (still including any CRC checksum).
+
+    :raise ValueError:
+        if the input isn't precisely one valid DLE/STX/ETX packet.
+    """
+    if not (bytes_in.startswith(b'\x10\x02') and bytes_in.endswith(b'\x10\x03')):
+        raise ValueError('data is not delimited by DLE STX and DLE ETX')
+    stuffed = bytes_in[2:-2]
+    if b'\x10' in stuffed.replace(b'\x10\x10', b''):
+        raise ValueError('data contains an unescaped DLE')
+    return stuffed.replace(b'\x10\x10', b'\x10')
+
+
+_PING_PACKET: bytes = _frame(PingMessage().to_bytes())
+"""
+The complete DLE/STX/ETX packet sent by :meth:`PID.ping`.
+"""
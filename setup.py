@@ -28,7 +28,6 @@ setuptools.setup(
     install_requires=[
         'attrs',
         'dlestxetx',
-        'crccheck',
         'pyserial',
     ],
     tests_require=[
@@ -1,7 +1,12 @@
+from io import BytesIO
+
+import attr
 import dlestxetx
 from pytest import raises
 
-from metlinkpid import DisplayMessage, _crc, _uncrc, inspect, Page, PingMessage, ResponseMessage
+from metlinkpid import (
+    DisplayMessage, Message, _crc, _frame, _uncrc, _unframe, inspect, Page, PID, PingMessage, ResponseMessage,
+)
 
 FUNKYTOWN_STR = 'V40^12:34 FUNKYTOWN~5_Limited Express|H0^_Stops all stations except East Richard'
 
@@ -9,8 +14,13 @@ FUNKYTOWN_STR = 'V40^12:34 FUNKYTOWN~5_Limited Express|H0^_Stops all stations ex
 def test_page():
     page = Page.from_str('12:34 FUNKYTOWN~5_Limited Express')
     assert str(page) == 'N20^12:34 FUNKYTOWN~5_Limited Express'
+    assert str(Page.from_str('h^_Text', default_delay=5)) == 'H5^_Text'
+    assert str(Page.from_str('7^Text')) == 'N7^Text'
+    assert str(Page.from_str('XY^Text')) == 'N20^XY^Text'
+    assert Page.from_str('N0^\u2022 \u2501\u00B7A').to_bytes() == b'\x00\x00\x00\x00\xD3 \xD2\x8FA'
     page = Page.from_bytes(b'\x00\x00\x00\x00\xFF')
     assert str(page) == 'N0^\N{REPLACEMENT CHARACTER}'
+    assert Page.from_bytes(b'\x00\x00\x00\x00"\x98\xA4\x5F').text == "'\u2500\u2594\u2588"
 
     with raises(ValueError):
         too_short = b'\x00\x00\x00'
@@ -27,6 +37,11 @@ def test_displaymessage():
     dm = DisplayMessage.from_str(FUNKYTOWN_STR)
     assert str(dm) == FUNKYTOWN_STR
     assert dm == eval(repr(dm))
+    assert dm is DisplayMessage.from_str(FUNKYTOWN_STR)
+    assert dm.to_bytes() is dm.to_bytes()
+    assert str(dm) is str(dm)
+    assert attr.asdict(dm) == {'pages': [{'animate': page.animate, 'delay': page.delay, 'text': page.text}
+                                          for page in dm.pages]}
 
     with raises(ValueError):
         DisplayMessage.from_bytes(b'')
@@ -34,6 +49,8 @@ def test_displaymessage():
         DisplayMessage.from_bytes(b'\x01\x44\x00')
     with raises(ValueError):
         DisplayMessage.from_bytes(b'\x01\x44\x00\x00\x00\x00\x00\x0D\xFF')
+    with raises(ValueError):
+        DisplayMessage.from_bytes(b'\x01\x44\x00\x00\x00\x00\x00\x0D\x0D')
 
 
 def test_pingmessage():
@@ -63,8 +80,23 @@ def test_responsemessage():
 
 
 def test_pid():
-    # TODO: PID class tests need a suitable serial mocking interface.
-    pass
+    serial = BytesIO()
+    PID(serial=serial, ignore_responses=True).ping()
+    assert serial.getvalue() == b'\x10\x02\x01\x50\x6F\x16\xD4\x10\x03'
+
+    framed = b'\x10\x02\x01\x50\x6F\x16\xD4\x10\x03'
+    serial = BytesIO()
+    PID(serial=serial, ignore_responses=True).send(framed)
+    assert serial.getvalue() == framed
+
+    raw = DisplayMessage.from_str(FUNKYTOWN_STR).to_bytes()
+    serial = BytesIO()
+    PID(serial=serial, ignore_responses=True).send(raw)
+    assert serial.getvalue() == _frame(raw)
+
+    serial = BytesIO()
+    PID(serial=serial, ignore_responses=True).send(bytearray(b'\x01\x50\x6F'))
+    assert serial.getvalue() == b'\x10\x02\x01\x50\x6F\x16\xD4\x10\x03'
 
 
 def test_inspect():
@@ -75,8 +107,31 @@ def test_inspect():
     framed = dlestxetx.encode(dm1.to_bytes() + _crc(dm1.to_bytes()))
     assert inspect(framed) == dm1
 
+    assert inspect(PingMessage().to_bytes()) == PingMessage()
+    assert inspect(bytearray(PingMessage().to_bytes())) == PingMessage()
+    assert inspect(bytearray(_frame(PingMessage().to_bytes()))) == PingMessage()
+    assert inspect(b'\x01\x52\x80\x00') == ResponseMessage(unspecified_byte=0x80)
+
     with raises(ValueError):
         inspect(b'<bogus bytes>')
+    with raises(ValueError):
+        unterminated = framed[:-2]
+        inspect(unterminated)
+
+
+def test_message_marker():
+    assert DisplayMessage.marker() == b'\x01\x44\x00'
+
+    class MarkerlessMessage(Message):
+        @classmethod
+        def from_bytes(cls, bytes_in):
+            return cls()
+
+        def to_bytes(self):
+            return b''
+
+    with raises(TypeError):
+        MarkerlessMessage()
 
 
 def test_crc():
@@ -91,3 +146,28 @@ def test_crc():
     with raises(ValueError):
         with_bad_crc = b'\x00\x00\x00'
         _uncrc(with_bad_crc)
+
+
+def test_frame():
+    for bytes_in in (b'', b'\x10', b'%\xB0\xB7', DisplayMessage.from_str(FUNKYTOWN_STR).to_bytes()):
+        assert _frame(bytes_in) == dlestxetx.encode(bytes_in + _crc(bytes_in))
+        assert _unframe(_frame(bytes_in)) == bytes_in + _crc(bytes_in)
+
+    with raises(ValueError):
+        _unframe(b'\x10\x02\x01\x50')
+    with raises(ValueError):
+        _unframe(b'\x10\x02\x10\x41\x10\x03')
+
+
+def test_crc_matches_reference():
+    def bitwise_crc(bytes_in):
+        crc = 0xFFFF
+        for byte in bytes_in:
+            crc ^= byte
+            for _ in range(8):
+                crc = (crc >> 1) ^ 0x8408 if crc & 1 else crc >> 1
+        return (crc ^ 0xFFFF).to_bytes(2, 'little')
+
+    assert _crc(b'123456789') == b'\x6E\x90'
+    for bytes_in in (b'', b'123456789', bytes(range(256)), DisplayMessage.from_str(FUNKYTOWN_STR).to_bytes()):
+        assert _crc(bytes_in) == bitwise_crc(bytes_in)